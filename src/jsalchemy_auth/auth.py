@@ -1,16 +1,16 @@
-from functools import reduce, partial
-from itertools import groupby
-from operator import itemgetter
-from typing import Type, Dict, List, Any, Optional, Set
+import asyncio
+from collections import defaultdict
+from functools import partial
+from typing import Type, Dict, List, Any, Optional, Set, Tuple
 
-from sqlalchemy import Integer, select, Select
-from sqlalchemy.orm import mapped_column, DeclarativeBase
+from sqlalchemy import Integer, exists, lambda_stmt, literal, select, Select
+from sqlalchemy.orm import mapped_column, raiseload, DeclarativeBase
 
 from jsalchemy_web_context import db as session
 from jsalchemy_web_context.cache import redis_cache, request_cache
 from .checkers import Path, Global
 from .models import UserMixin, UserGroupMixin, RoleMixin, PermissionMixin, define_tables
-from .utils import Context, to_context, inverted_properties, ContextSet, table_to_class, get_target_table, clean_prefix
+from .utils import Context, to_context, inverted_properties, ContextSet, table_to_class, get_target_table, clean_prefix, single_flight
 
 
 class PermissionGrantError(Exception):
@@ -26,10 +26,6 @@ class Auth:
     including propagation schemas, role-to-permission mappings, and user/group
     permission checks. """
 
-    _all_paths: Dict[str, Path] = {}
-    _propagation_schema: Dict[str, List[str]] = {}
-    _inv_propagation_schema: Dict[str, List[str]] = {}
-
     def __init__(
             self,
             base_class: DeclarativeBase,
@@ -39,9 +35,12 @@ class Auth:
             group_model: Type[UserGroupMixin] = None,
             role_model: Type[RoleMixin] = None,
             permission_model: Type[PermissionMixin] = None,
+            strict_loading: bool = False,
 
     ):
         self.actions = actions or {}
+        self._auto_actions: Set[Tuple[str, str]] = set()
+        self.strict_loading = strict_loading
         self.user_model = user_model
         self.group_model = group_model
         self.role_model = role_model
@@ -54,6 +53,11 @@ class Auth:
                     permission.auth = self
         self.propagation_schema = propagation_schema or {}
         self.to_class = partial(table_to_class, self.base_class)
+        self._perms_to_roles_cache: Optional[Dict[str, Set[int]]] = None
+        self._perm_name_ids_cache: Optional[Dict[str, int]] = None
+        self._role_cache: Dict[str, RoleMixin] = {}
+        self._action_roles: Dict[str, frozenset] = {}
+        self._role_tables: Dict[int, frozenset] = {}
 
     @property
     def propagation_schema(self):
@@ -63,6 +67,24 @@ class Auth:
     def propagation_schema(self, value):
         self._permission_schema = value or {}
         self._inv_propagation_schema = inverted_properties(value or {}, self.base_class.registry)
+        # Resolve every schema edge to its target class name once, so the
+        # path explosion below never touches the registry or the mappers.
+        mappers = {m.class_.__name__: m for m in self.base_class.registry.mappers}
+        self._schema_edges = {
+            class_name: {(attr, mappers[class_name].mapper.relationships[attr].entity.class_.__name__)
+                         for attr in attrs}
+            for class_name, attrs in self._inv_propagation_schema.items()}
+        self._paths_cache: Dict[str, Set[str]] = {}
+        # The auto-composed checkers embed traversal paths derived from the
+        # schema that just changed: drop them so they are rebuilt on demand.
+        # Checkers supplied explicitly through `actions` are kept.
+        for model_name, action in self._auto_actions:
+            self.actions.get(model_name, {}).pop(action, None)
+        self._auto_actions = set()
+        # Warm the path cache for every model the new schema reaches, so the
+        # first can() per model does not pay the path explosion.
+        for model_name in self._inv_propagation_schema:
+            self._explode_partial_schema(model_name)
 
     @property
     def inv_propagation_schema(self):
@@ -80,103 +102,202 @@ class Auth:
                              ('role_model', RoleMixin), ('permission_model', PermissionMixin)]:
             if not getattr(self, model):
                 class_name = ''.join(map(str.capitalize, model.split("_")[:-1]))
+                tablename = class_name.lower() + 's'
+                if tablename in Base.metadata.tables:
+                    # Already built for this base class: reuse the mapped class
+                    # instead of re-registering a duplicate mapper.
+                    setattr(self, model, table_to_class(Base, tablename))
+                    continue
                 if 'id' not in getattr(mixin, '__annotations__'):
                     setattr(mixin, 'id', mapped_column(Integer, primary_key=True))
-                setattr(self, model, type(class_name, (mixin, Base), {'__tablename__': class_name.lower() + 's'}))
+                setattr(self, model, type(class_name, (mixin, Base), {'__tablename__': tablename}))
 
         # Create all tables in the database
         role_permission, rolegrant, membership = define_tables(
             Base, self.user_model, self.group_model, self.role_model, self.permission_model)
 
-    async def _get_role(self, name: str) -> Optional[RoleMixin]:
-        """Get a role by name."""
-        result = await session.execute(
-            select(self.role_model)
-            .where(self.role_model.name == name)
-        )
-        return result.scalar_one_or_none()
+    def _loader_guard(self, stmt: Select) -> Select:
+        """Append ``raiseload('*')`` when strict loading is enabled.
 
-    async def _get_or_create_permission(self, name: str):
-        """Get or create a permission by name."""
-        result = await session.execute(
-            self.permission_model.__table__.select().where(
-                self.permission_model.__table__.c.name == name
+        With `strict_loading` any accidental lazy load triggered by the auth
+        paths fails loudly instead of silently degrading into an N+1."""
+        if self.strict_loading:
+            return stmt.options(raiseload('*'))
+        return stmt
+
+    async def _get_role(self, name: str) -> Optional[RoleMixin]:
+        """Get a role by name, cached on the instance (roles are near-immutable).
+
+        The hot paths only read ``id``, ``name`` and ``tables``, so the query
+        projects just those columns and a plain Row is returned — no ORM
+        entity is hydrated and nothing enters the identity map."""
+        role = self._role_cache.get(name)
+        if role is None:
+            result = await session.execute(
+                select(self.role_model.id,
+                       self.role_model.name,
+                       self.role_model.tables)
+                .where(self.role_model.name == name)
             )
-        )
-        perm = result.fetchone()
-        if not perm:
-            new_perm = self.permission_model(name=name)
-            session.add(new_perm)
+            role = result.fetchone()
+            if role is not None:
+                self._role_cache[name] = role
+        return role
+
+    def _role_table_set(self, role: RoleMixin) -> frozenset:
+        """Return the set of table names a role is restricted to.
+
+        The comma-separated ``role.tables`` column is split once per role and
+        cached, keeping the string parsing off the grant hot path."""
+        tables = self._role_tables.get(role.id)
+        if tables is None:
+            tables = frozenset(role.tables.split(',')) if role.tables else frozenset()
+            self._role_tables[role.id] = tables
+        return tables
+
+    async def _get_or_create_permissions(self, names) -> Dict[str, PermissionMixin]:
+        """Get or create several permissions at once.
+
+        One `IN` SELECT for the existing rows, one bulk flush for the
+        missing ones — never a query per name."""
+        permissions = {p.name: p for p in (await session.execute(self._loader_guard(
+            select(self.permission_model)
+            .where(self.permission_model.name.in_(names))))).scalars()}
+        missing = [self.permission_model(name=name)
+                   for name in names if name not in permissions]
+        if missing:
+            session.add_all(missing)
             await session.flush()
-            return new_perm
-        return perm
+            permissions.update((p.name, p) for p in missing)
+        return permissions
 
     async def _get_or_create_role(self, name: str) -> RoleMixin:
         """Get or create a role by name."""
         role = await self._get_role(name)
         if not role:
-            new_role = self.role_model(name=name)
-            session.add(new_role)
+            role = self.role_model(name=name)
+            session.add(role)
             await session.flush()
-            return new_role
+            self._role_cache[name] = role
         return role
 
-    async def _user_groups(self, user_id: int) -> List[int]:
-        """Get the user groups for a user."""
+    @request_cache('user_id')
+    async def _user_groups(self, user_id: int) -> frozenset:
+        """Get the user groups for a user, cached for the current request.
+
+        The result is a frozenset: it is shared by every caller within the
+        request, so it must not be mutated downstream."""
         result = await session.execute(
-            membership.select().where(
-                (membership.c.user_id == user_id)
-            )
+            # lambda statement: the SQL is compiled once and re-used with
+            # user_id as the only varying bind parameter.
+            lambda_stmt(lambda: select(membership.c.usergroup_id).where(
+                membership.c.user_id == user_id
+            ))
         )
-        return {row.usergroup_id for row in result.fetchall()}
-
-    @request_cache('group_id', 'context.id', 'context.table')
-    @redis_cache('group_id', 'context.id', 'context.table')
-    async def _contextual_roles(self, group_id: int, context: Context) -> Set[int]:
-        """Get the Set of Role.ids for a set of groups identified by their ids."""
+        return frozenset(result.scalars())
+
+    @request_cache('group_ids', 'context.id', 'context.table')
+    @single_flight
+    async def _contextual_roles_many(self, group_ids: frozenset, context: Context) -> frozenset:
+        """Get the set of Role.ids granted to any of the groups in the context.
+
+        One `IN (...)` query for the whole group set instead of a round trip
+        per group. Request-cached so that path traversals over many objects
+        sharing ancestors (the list-endpoint case) resolve each ancestor
+        context once, and single-flighted so concurrent cache misses for the
+        same (groups, context) collapse into one query; the frozenset result
+        is shared through the cache and must not be mutated downstream."""
+        if not group_ids:
+            return frozenset()
         result = await session.execute(
             select(rolegrant.c.role_id).where(
-                (rolegrant.c.usergroup_id == group_id) &
+                (rolegrant.c.usergroup_id.in_(group_ids)) &
                 (rolegrant.c.context_id == context.id) &
                 (rolegrant.c.context_table == context.table)
             )
         )
-        return set(result.scalars())
+        return frozenset(result.scalars())
 
     @request_cache()
     @redis_cache()
-    async def _perms_to_roles(self) -> Dict[int, Set[int]]:
-        all = (await session.execute(
+    async def _load_perms_to_roles(self) -> Dict[str, Set[int]]:
+        result = await session.stream(
             select(self.permission_model.name, role_permission.c.role_id)
-            .join(role_permission, self.permission_model.id == role_permission.c.permission_id))).all()
-        return {p: set(map(itemgetter(1), group))
-                for p, group in groupby(sorted(all), itemgetter(0))}
+            .join(role_permission, self.permission_model.id == role_permission.c.permission_id)
+            .execution_options(yield_per=1000))
+        out = defaultdict(set)
+        async for name, role_id in result:
+            out[name].add(role_id)
+        # Freeze the values: the mapping is shared by every caller through
+        # the caches, so nobody may mutate the role-id sets downstream.
+        return {name: frozenset(role_ids) for name, role_ids in out.items()}
+
+    async def _perms_to_roles(self) -> Dict[str, Set[int]]:
+        """Return the permission name to role ids mapping, cached in-process.
+
+        The mapping only changes on `assign`/`unassign`, so it is kept on the
+        instance and dropped by `_invalidate_permission_caches`."""
+        if self._perms_to_roles_cache is None:
+            self._perms_to_roles_cache = await self._load_perms_to_roles()
+        return self._perms_to_roles_cache
 
     @request_cache()
     @redis_cache()
+    async def _load_perm_name_ids(self) -> Dict[str, int]:
+        return {row.name: row.id
+                for row in await session.execute(
+                    select(self.permission_model.name,
+                           self.permission_model.id))}
+
     async def _perm_name_ids(self) -> Dict[str, int]:
         """Retrieve a mapping of permission names to their database IDs.
 
         Returns:
             dict: A dictionary mapping permission names to IDs."""
-        return {row.name: row.id
-                for row in await session.execute(
-                    select(self.permission_model.name,
-                           self.permission_model.id))}
+        if self._perm_name_ids_cache is None:
+            self._perm_name_ids_cache = await self._load_perm_name_ids()
+        return self._perm_name_ids_cache
+
+    async def _invalidate_permission_caches(self):
+        """Drop every cached permission to role mapping, local and shared."""
+        self._perms_to_roles_cache = None
+        self._perm_name_ids_cache = None
+        self._role_cache.clear()
+        self._action_roles.clear()
+        self._role_tables.clear()
+        # The discards are independent cache round-trips: overlap them.
+        await asyncio.gather(
+            self._load_perms_to_roles.discard_all(),
+            self._load_perm_name_ids.discard_all(),
+            self._can.discard_all(),
+            self._contexts_by_permission.discard_all(),
+        )
 
-    async def _resolve_permission(self, permission_name: str) -> Set[int]:
+    async def _resolve_permission(self, permission_name: str) -> frozenset:
         """Find all role IDs associated with a given permission name.
 
         Args:
             permission_name (str): The name of the permission to resolve.
 
         Returns:
-            set[int]: A set of role IDs associated with the permission."""
+            frozenset[int]: The role IDs associated with the permission.
+            Always a frozenset, so callers can use it as a cache key."""
         ref = await self._perms_to_roles()
         if permission_name not in ref:
-            return set()
+            return frozenset()
         return ref[permission_name]
 
+    async def _action_role_ids(self, action: str) -> frozenset:
+        """Resolve an action name to the frozen set of role ids granting it.
+
+        The result is cached per action and dropped together with the
+        permission maps, so repeated `can` calls skip the resolution."""
+        role_ids = self._action_roles.get(action)
+        if role_ids is None:
+            role_ids = frozenset(await self._resolve_permission(action))
+            self._action_roles[action] = role_ids
+        return role_ids
+
     @request_cache()
     @redis_cache()
     async def _global_permissions(self) -> Set[str]:
@@ -184,12 +305,12 @@ class Auth:
 
         Returns:
             set[str]: A set of global permission names."""
-        result = await session.execute(
+        result = await session.stream(
             select(self.permission_model.name).where(
                 self.permission_model.is_global == True
-            )
+            ).execution_options(yield_per=1000)
         )
-        return set(result.scalars())
+        return {name async for name in result.scalars()}
 
     async def _has_any_role(self, group_ids: Set[int], role_ids: Set[int]) -> bool:
         """Check if any of the provided groups have any of the specified roles.
@@ -201,16 +322,16 @@ class Auth:
         Returns:
             bool: True if any group has any of the specified roles."""
         return bool((await session.execute(
-            rolegrant.select().where(
+            select(exists().where(
                 (rolegrant.c.usergroup_id.in_(group_ids)) &
                 (rolegrant.c.role_id.in_(role_ids))
-            )
+            ))
         )).scalar())
 
     @property
     def inverted_schema(self):
         """Return the inverted schema."""
-        return inverted_properties(self.propagation_schema)
+        return self._inv_propagation_schema
 
     def _explode_partial_schema(self, model_name: str, depth: int = 0) -> Set[str]:
         """Traverse the schema to build all possible paths from a model class.
@@ -221,122 +342,114 @@ class Auth:
 
         Returns:
             set[str]: Set of all paths derived from the schema."""
-        def explore_recursive(current_node: str, current_path: str, used_edges: set) -> List[str]:
-            """Recursively explore all paths from current node"""
-            # If node doesn't exist in schema, return current path
-            if current_node not in schema:
-                return [current_path] if current_path else []
-
-            relationships = schema[current_node]
-            all_paths = []
-
-            for field_name, target_node in relationships:
-                # Create edge identifier: (source_node, field_name, target_node)
-                edge = (current_node, field_name, target_node)
-
-                # Skip if this edge has already been used in current path
-                if edge in used_edges:
-                    continue
-
-                # Build the path segment
-                new_path = f"{current_path}.{field_name}" if current_path else field_name
-
-                # Create new set of used edges for this path
-                new_used_edges = used_edges.copy()
-                new_used_edges.add(edge)
+        if model_name in self._paths_cache:
+            return self._paths_cache[model_name]
 
-                # If target node exists in schema, continue exploring
-                if target_node in schema:
-                    sub_paths = explore_recursive(target_node, new_path, new_used_edges)
-                    all_paths.extend(sub_paths)
-                else:
-                    # Target node not in schema, this is a terminal path
-                    all_paths.append(new_path)
-
-            return all_paths
-
-
-        mappers = {m.class_.__name__: m for m in self.base_class.registry.mappers}
-        schema = {class_name: {(attr, mappers[class_name].mapper.relationships[attr].entity.class_.__name__)
-                               for attr in attrs}
-                  for class_name, attrs in self.inv_propagation_schema.items()}
+        schema = self._schema_edges
         # Handle edge case where starting node doesn't exist
         if model_name not in schema:
-            return set()
-
-        all_paths = explore_recursive(model_name, "", set())
-        return clean_prefix(all_paths)
+            paths = set()
+        else:
+            # Iterative depth-first walk: each frame carries the node, the
+            # dotted path so far and the frozenset of edges already used, so
+            # no recursion frames or per-edge set comprehensions are built.
+            all_paths = []
+            stack = [(model_name, "", frozenset())]
+            while stack:
+                node, path, used_edges = stack.pop()
+                for field_name, target_node in schema[node]:
+                    edge = (node, field_name, target_node)
+                    # Skip if this edge has already been used in current path
+                    if edge in used_edges:
+                        continue
+                    new_path = f"{path}.{field_name}" if path else field_name
+                    if target_node in schema:
+                        stack.append((target_node, new_path, used_edges | {edge}))
+                    else:
+                        # Target node not in schema, this is a terminal path
+                        all_paths.append(new_path)
+            paths = clean_prefix(all_paths)
+        self._paths_cache[model_name] = paths
+        return paths
 
     async def set_permission_global(self, is_global: bool, *permission_name: List[str]):
         """Set a permission to be global."""
-        existing_permissions = (await session.execute(
-            select(self.permission_model).where(
-                (self.permission_model.name.in_(permission_name))
+        # One bulk UPDATE for the existing names, one executemany INSERT for
+        # the missing ones; no ORM rows are hydrated along the way.
+        existing_names = set((await session.execute(
+            select(self.permission_model.name).where(
+                self.permission_model.name.in_(permission_name)
+            )
+        )).scalars())
+        if existing_names:
+            await session.execute(
+                self.permission_model.__table__.update()
+                .where(self.permission_model.name.in_(existing_names))
+                .values(is_global=is_global)
+            )
+        missing = set(permission_name) - existing_names
+        if missing:
+            await session.execute(
+                self.permission_model.__table__.insert(),
+                [{'name': name, 'is_global': is_global} for name in missing]
             )
-        )).scalars().all()
-        for permission in existing_permissions:
-            permission.is_global = is_global
-        for name in set(permission_name).difference({p.name for p in existing_permissions}):
-            session.add(self.permission_model(name=name, is_global=is_global))
         await session.flush()
-        await self._global_permissions.discard_all()
+        await asyncio.gather(
+            self._global_permissions.discard_all(),
+            self._invalidate_permission_caches(),
+        )
 
     async def assign(self, role_name: str, *permission_name: List[str]):
-        """Assigns a permission to a role."""
-        # Find or create the permission
+        """Assigns permissions to a role."""
         role = await self._get_or_create_role(role_name)
+        permissions = await self._get_or_create_permissions(permission_name)
 
-        # Find or create roles and associate them with the permission
-        for permission_n in permission_name:
-            permission = await self._get_or_create_permission(permission_n)
-            # Check if this association already exists
-            existing_assoc = await session.execute(
-                role_permission.select().where(
-                    (role_permission.c.role_id == role.id) &
-                    (role_permission.c.permission_id == permission.id)
-                )
-            )
-
-            if not existing_assoc.fetchone():
-                await session.execute(
-                    role_permission.insert().values(
-                        role_id=role.id,
-                        permission_id=permission.id
-                    )
-                )
-        await self._perms_to_roles.discard_all()
-
-    async def unassign(self, role_name: str, pemrission_names: List[str]) -> bool:
-        """Removes a permission from a role."""
-        # Find the permission
-        permission_ids = await session.execute(
-            role_permission.select(role_permission.c.permission_id).where(
-                (role_permission.c.permission_name.in_(pemrission_names))
+        # Insert only the associations that do not exist yet, in one statement
+        permission_ids = {p.id for p in permissions.values()}
+        existing = set((await session.execute(
+            select(role_permission.c.permission_id).where(
+                (role_permission.c.role_id == role.id) &
+                (role_permission.c.permission_id.in_(permission_ids))
             )
-        ).scalars()
-
-        # Find the role
-        role = await self._get_role(role_name)
-        if not role:
-            return
-
-        # Remove the association
+        )).scalars())
+        new_associations = [{'role_id': role.id, 'permission_id': permission_id}
+                            for permission_id in permission_ids - existing]
+        if new_associations:
+            await session.execute(role_permission.insert(), new_associations)
+        await self._invalidate_permission_caches()
+
+    async def unassign(self, role_name: str, *permission_names: List[str]):
+        """Removes permissions from a role."""
+        # Remove the associations with a single DELETE; both the role id and
+        # the permission ids are resolved by the database through subqueries,
+        # so no preliminary SELECT round trip is needed.
         await session.execute(
             role_permission.delete().where(
-                (role_permission.c.role_id == role.id) &
-                (role_permission.c.permission_id in permission_ids)
+                (role_permission.c.role_id == select(self.role_model.id)
+                    .where(self.role_model.name == role_name)
+                    .scalar_subquery()) &
+                (role_permission.c.permission_id.in_(
+                    select(self.permission_model.id)
+                    .where(self.permission_model.name.in_(permission_names))))
             )
         )
+        await self._invalidate_permission_caches()
 
     async def _get_user_group(self, user: UserMixin) -> UserGroupMixin:
-        private_groups = {g for g in await user.awaitable_attrs.memberships if g.is_personal and g.owner_id == user.id}
-        if not private_groups:
+        # Query the personal group directly instead of loading the whole
+        # memberships collection and filtering it in Python.
+        user_group = (await session.execute(self._loader_guard(
+            select(self.group_model).where(
+                (self.group_model.owner_id == user.id) &
+                (self.group_model.is_personal == True)
+            ).limit(1)
+        ))).scalar_one_or_none()
+        if user_group is None:
             user_group = self.group_model(owner_id=user.id, is_personal=True, name=f'private:{user.id}')
             (await user.awaitable_attrs.memberships).append(user_group)
             session.add(user_group)
             await session.flush()
-        else:
-            user_group = next(iter(private_groups))
+            await self._user_groups.discard(self, user.id)
         return user_group
 
     async def grant(self, user_group: UserGroupMixin | UserMixin, role_name: str, context) -> bool:
@@ -352,32 +465,34 @@ class Auth:
             raise PermissionGrantError(f"Role {role_name} does not exist")
 
         # Check if the role's associated tables include the context table
-        if role.tables and context.table not in role.tables.split(','):
+        role_tables = self._role_table_set(role)
+        if role_tables and context.table not in role_tables:
             raise PermissionGrantError(
                 f"Role {role_name} cannot be granted to table {context.table}"
             )
 
-        # Check if this grant already exists
-        existing_grant = await session.execute(
-            rolegrant.select().where(
-                (rolegrant.c.usergroup_id == user_group.id) &
-                (rolegrant.c.role_id == role.id) &
-                (rolegrant.c.context_id == context.id) &
-                (rolegrant.c.context_table == context.table)
+        # Insert-if-absent in one statement: the SELECT only yields a row when
+        # the grant does not exist yet, so there is no check-then-insert race
+        # and the boolean result derives from the rowcount.
+        result = await session.execute(
+            rolegrant.insert().from_select(
+                ['usergroup_id', 'role_id', 'context_id', 'context_table'],
+                select(literal(user_group.id), literal(role.id),
+                       literal(context.id), literal(context.table))
+                .where(~exists(select(1).where(
+                    (rolegrant.c.usergroup_id == user_group.id) &
+                    (rolegrant.c.role_id == role.id) &
+                    (rolegrant.c.context_id == context.id) &
+                    (rolegrant.c.context_table == context.table))))
             )
         )
 
-        if not existing_grant.fetchone():
-            await session.execute(
-                rolegrant.insert().values(
-                    usergroup_id=user_group.id,
-                    role_id=role.id,
-                    context_id=context.id,
-                    context_table=context.table,
-                )
+        if result.rowcount:
+            await asyncio.gather(
+                self._contextual_roles_many.discard_all(),
+                self._can.discard_all(),
+                self._contexts_by_permission.discard_all(),
             )
-            await self._contextual_roles.discard(self, user_group.id, context)
-            # await self.contexts_by_permission.discard(self, user_group.id, context)
             return True
         return False
 
@@ -397,8 +512,11 @@ class Auth:
                 (rolegrant.c.context_table == context.table)
             )
         )
-        await self._contextual_roles.discard(self, user_group.id, context)
-        # await self.contexts_by_permission.discard(self, user_group.id, context)
+        await asyncio.gather(
+            self._contextual_roles_many.discard_all(),
+            self._can.discard_all(),
+            self._contexts_by_permission.discard_all(),
+        )
 
     def _action_checker(self, action: str, model_name: str):
         """find the checker for the action onto the context."""
@@ -408,37 +526,114 @@ class Auth:
             paths = self._explode_partial_schema(model_name)
             perm = Global(action, auth=self) | Path(action, auth=self, *paths)
             self.actions[model_name][action] = perm
+            self._auto_actions.add((model_name, action))
         return self.actions[model_name][action]
 
+    async def prefetch(self, target: DeclarativeBase, ids, action: str = 'read') -> None:
+        """Warm the traversal cache for checking `action` over many objects.
+
+        Call this before filtering a listing through `can()`: every level of
+        the action's checker paths is resolved for all ids with one batched
+        query per level, so the per-object checks hit the context cache
+        instead of resolving each object's ancestors one at a time."""
+        await self._action_checker(action, target.__name__).prefetch(target, ids)
+
     async def can(self, user, action: str, context):
         """Checks if a user can perform an action on the context."""
-        permission_name = action
+        return await self._can(user, action, to_context(context))
+
+    @request_cache('user.id', 'action', 'context.id', 'context.table')
+    async def _can(self, user, action: str, context: Context) -> bool:
+        """Request-cached (user, action, context) authorization edge.
+
+        Paginated listings and nested resolvers re-check the same triple many
+        times per request; after the first call the answer is a cache probe.
+        Grant and permission writes discard the edge cache."""
         group_ids = await self._user_groups(user.id)
-        role_ids = await self._resolve_permission(permission_name)
-        context = to_context(context)
+        role_ids = await self._action_role_ids(action)
 
         return await self._action_checker(action, context.model.__name__)(user, group_ids, role_ids, context)
 
     async def has_permission(self, user: UserMixin, permission_name: str, context: Context | DeclarativeBase):
         """Checks if a user has the specified permission into a specific `context`."""
-        role_ids = await self._resolve_permission(permission_name)
-        user_groups = await self._user_groups(user.id)
-        if isinstance(context, self.base_class):
-            context = to_context(context)
-        roles_ids = [await self._contextual_roles(group_id, context) for group_id in user_groups]
-        valid_roles = reduce(set.union, filter(bool, roles_ids), set())
-        return bool(role_ids.intersection(valid_roles))
+        # Globally scoped permissions ignore the context: holding any role
+        # that carries the permission is enough.
+        if permission_name in await self._global_permissions():
+            role_ids = await self._resolve_permission(permission_name)
+            group_ids = await self._user_groups(user.id)
+            return await self._has_any_role(group_ids, role_ids)
+        context = to_context(context)
+        user_id, context_id, context_table = user.id, context.id, context.table
+        permission_table = self.permission_model.__table__
+        result = await session.execute(lambda_stmt(
+            lambda: select(1)
+            .select_from(
+                membership
+                .join(rolegrant, rolegrant.c.usergroup_id == membership.c.usergroup_id)
+                .join(role_permission, role_permission.c.role_id == rolegrant.c.role_id)
+                .join(permission_table,
+                      permission_table.c.id == role_permission.c.permission_id))
+            .where(
+                (membership.c.user_id == user_id) &
+                (rolegrant.c.context_id == context_id) &
+                (rolegrant.c.context_table == context_table) &
+                (permission_table.c.name == permission_name))
+            .limit(1)))
+        return result.scalar() is not None
+
+    async def has_role(self, user: UserMixin, role_name: str,
+                       context: Context | DeclarativeBase = GLOBAL_CONTEXT) -> bool:
+        """Checks if a user holds the named role in the given `context`."""
+        context = to_context(context)
+        result = await session.execute(
+            select(1)
+            .select_from(
+                membership
+                .join(rolegrant, rolegrant.c.usergroup_id == membership.c.usergroup_id)
+                .join(self.role_model.__table__, self.role_model.id == rolegrant.c.role_id))
+            .where(
+                (membership.c.user_id == user.id) &
+                (rolegrant.c.context_id == context.id) &
+                (rolegrant.c.context_table == context.table) &
+                (self.role_model.name == role_name))
+            .limit(1))
+        return result.scalar() is not None
+
+    async def has_role_group(self, user_group: UserGroupMixin, role_name: str,
+                             context: Context | DeclarativeBase = GLOBAL_CONTEXT) -> bool:
+        """Checks if a UserGroup holds the named role in the given `context`."""
+        context = to_context(context)
+        result = await session.execute(
+            select(1)
+            .select_from(
+                rolegrant.join(self.role_model.__table__, self.role_model.id == rolegrant.c.role_id))
+            .where(
+                (rolegrant.c.usergroup_id == user_group.id) &
+                (rolegrant.c.context_id == context.id) &
+                (rolegrant.c.context_table == context.table) &
+                (self.role_model.name == role_name))
+            .limit(1))
+        return result.scalar() is not None
 
     async def contexts_by_permission(self, user: UserMixin | Set[int],
                                      permission: str,) -> Set[ContextSet]:
         """Find all contexts where the user has a specified permission."""
         if isinstance(user, UserMixin):
             group_ids = await self._user_groups(user.id)
-        elif isinstance(user, set):
-            group_ids = user
+        elif isinstance(user, (set, frozenset)):
+            group_ids = frozenset(user)
         else:
             raise ValueError("user must be a UserMixin or a set of group ids")
+        return await self._contexts_by_permission(group_ids, permission)
+
+    @request_cache('group_ids', 'permission')
+    async def _contexts_by_permission(self, group_ids: frozenset,
+                                      permission: str) -> Set[ContextSet]:
+        """Resolve the contexts granting `permission` to a fixed group set.
 
+        Request-cached: composed checkers ask for the same (groups,
+        permission) pair several times while building one query. Grant and
+        revoke discard the cache."""
         role_ids = await self._resolve_permission(permission)
 
         if not group_ids or not role_ids:
@@ -453,22 +648,25 @@ class Auth:
             )
         )
 
-        return {ContextSet(self.to_class(table), tuple(map(itemgetter(1), grp)))
-                for table, grp in groupby(sorted(result.fetchall()), itemgetter(0))}
+        # Single-pass hash grouping: only the (small) per-table id sets are
+        # sorted, instead of the whole result set.
+        groups = defaultdict(set)
+        for table, context_id in result:
+            groups[table].add(context_id)
+        return {ContextSet(self.to_class(table), tuple(sorted(ids)))
+                for table, ids in groups.items()}
 
     async def object_with_permission(self, user: UserMixin, permission: str):
         """finds every object the user has the permission to."""
         contexts = await self.contexts_by_permission(user, permission)
         ret = set()
+        # One IN query per model; the loop stays sequential because a single
+        # AsyncSession does not permit concurrent operations.
         for context in contexts:
-            if isinstance(context, ContextSet):
-                ret.update((await session.execute(
-                    select(context.model)
-                    .where(context.model.id.in_(context.ids)))).scalars().all())
-            else:
-                ret.add((await session.
-                    select(context.model)
-                    .where(context.model.id == context.id)).scalar_one_or_none())
+            ids = context.ids if isinstance(context, ContextSet) else (context.id,)
+            ret.update((await session.execute(self._loader_guard(
+                select(context.model)
+                .where(context.model.id.in_(ids))))).scalars().all())
         return ret
 
     async def accessible_query(self, user: UserMixin, query: Select, action: str='read', false_=None):
@@ -486,7 +684,10 @@ class Auth:
         target = self.to_class(table)
         checker = self._action_checker(action, target.__name__)
         group_ids = await self._user_groups(user.id)
-        joins = [join for join in await checker.joins(group_ids, target)]
+        # joins and where run sequentially on purpose: both issue statements
+        # on the request's one AsyncSession, which does not allow concurrent
+        # operations, and where() reuses the context lookups joins() warmed.
+        joins = await checker.joins(group_ids, target)
         if None in joins:
             return query
         if False in joins:
@@ -8,11 +8,11 @@ permissions, ownership checks, group membership, and global permissions.
 
 from typing import Set, List
 
-from sqlalchemy import Select, or_
+from sqlalchemy import Select, false, or_, true
 from sqlalchemy.orm import DeclarativeBase, RelationshipProperty
 
 from jsalchemy_auth.traversers import treefy_paths, tree_traverse, traverse, class_traverse, all_paths, \
-    aggregate_references
+    aggregate_references, warm_paths
 from jsalchemy_auth.utils import to_context, Context, invert_prop, ContextSet
 from .models import UserMixin
 
@@ -27,9 +27,14 @@ class PermissionChecker:
 
     Attributes:
         auth: Reference to the authentication system instance
+        cost: Relative price of one __call__, used to order Or branches
     """
 
-    auth: "Auth" = None
+    __slots__ = ('auth',)
+
+    # Rough relative cost of evaluating this checker once; Or uses it to try
+    # the cheap branches first. Class-level so it coexists with __slots__.
+    cost: int = 5
 
     def __or__(self, other):
         """
@@ -68,6 +73,36 @@ class PermissionChecker:
         """Return string representation of the permission checker."""
         return f"- [{self.__class__.__name__}] -"
 
+    def _class_steps(self, target: DeclarativeBase, path: str) -> tuple:
+        """Memoized `class_traverse` result for a (target, path) pair.
+
+        The checker paths are fixed at construction and the targets are ORM
+        classes, so the relationship-property chains never change; caching
+        them keeps the mapper walking out of every joins()/where() call."""
+        key = (target, path)
+        steps = self._traverse_cache.get(key)
+        if steps is None:
+            steps = tuple(class_traverse(target, path))
+            self._traverse_cache[key] = steps
+        return steps
+
+    async def prefetch(self, target: DeclarativeBase, ids) -> None:
+        """
+        Warm the traversal cache for the objects about to be checked.
+
+        The traversals behind `__call__` never read ORM instance state: they
+        resolve each path level through the shared context cache, one object
+        at a time. Prefetching therefore means batch-resolving the checker
+        paths for all ids up front, so the per-object checks become cache
+        hits. The base checker traverses nothing, so there is nothing to
+        warm.
+
+        Args:
+            target: The target database model the objects belong to
+            ids: Iterable of ids of the objects about to be checked
+        """
+        return None
+
     async def joins(self, group_ids: Set[int], target: DeclarativeBase, permission_name: str = 'read') -> List[
         RelationshipProperty]:
         """
@@ -105,6 +140,21 @@ class PermissionChecker:
         raise NotImplementedError
 
 
+def _order_by_depth(tree: dict) -> dict:
+    """Return a path tree with its shallow branches first.
+
+    Light-first ordering lets traversals exhaust the cheap branches — and
+    possibly exit early — before descending into the deep ones."""
+    if not tree:
+        return tree
+
+    def depth(subtree):
+        return 1 + max(map(depth, subtree.values()), default=0) if subtree else 0
+
+    return {key: _order_by_depth(subtree)
+            for key, subtree in sorted(tree.items(), key=lambda item: depth(item[1]))}
+
+
 class Path(PermissionChecker):
     """
     Permission checker that validates permissions based on path traversal.
@@ -118,6 +168,10 @@ class Path(PermissionChecker):
         auth: Reference to the authentication system instance
     """
 
+    __slots__ = ('permission', 'paths', '_all_paths', '_traverse_cache', '_compiled_cache')
+
+    cost = 10  # full tree traversal
+
     def __init__(self, permission: str, *path: List[str], auth: "Auth" = None):
         """
         Initialize a Path permission checker.
@@ -128,8 +182,31 @@ class Path(PermissionChecker):
             auth: Reference to the authentication system instance
         """
         self.permission = permission
-        self.paths = treefy_paths(*path) or {}
+        self.paths = _order_by_depth(treefy_paths(*path) or {})
+        # The path tree is fixed from here on: materialize its flattened
+        # form once instead of re-running the all_paths generator per call.
+        self._all_paths = tuple(all_paths(self.paths))
         self.auth = auth
+        self._traverse_cache = {}
+        self._compiled_cache = {}
+
+    def _compiled_paths(self, target: DeclarativeBase) -> tuple:
+        """Compile every checker path against a target class, once.
+
+        Each entry pairs the traversal steps with per-step recursion flags
+        (whether the step re-enters a table already on the path), so joins()
+        and where() consume one shared precomputed structure instead of
+        re-deriving both per call."""
+        compiled = self._compiled_cache.get(target)
+        if compiled is None:
+            compiled = tuple(
+                (steps,
+                 tuple(step.target in step.parent.tables for step in steps),
+                 tuple(self.auth.to_class(step.target) for step in steps))
+                for steps in (self._class_steps(target, path)
+                              for path in self._all_paths))
+            self._compiled_cache[target] = compiled
+        return compiled
 
     async def __call__(self, user: UserMixin, group_ids: Set[int], role_ids: Set[int], object: DeclarativeBase) -> bool:
         """
@@ -144,16 +221,31 @@ class Path(PermissionChecker):
         Returns:
             bool: True if user has permission, False otherwise
         """
+        # Resolve the permitted contexts once up front (one request-cached
+        # query), so the traversal below is pure membership testing instead
+        # of a role lookup per discovered context.
+        if type(group_ids) is not frozenset:
+            group_ids = frozenset(group_ids)
+        permitted = await self.auth._contexts_by_permission(group_ids, self.permission)
+        if not permitted:
+            return False
+        permitted_ids = {context_set.table: frozenset(context_set.ids)
+                         for context_set in permitted}
         async for contexts in tree_traverse(object, self.paths, is_root=True):
             if isinstance(contexts, Context):
                 contexts = [contexts]
             for context in contexts:
-                for group_id in group_ids:
-                    context_role_ids = await self.auth._contextual_roles(group_id, context)
-                    if context_role_ids.intersection(role_ids):
-                        return True
+                ids = permitted_ids.get(context.table)
+                if ids is not None and context.id in ids:
+                    return True
         return False
 
+    async def prefetch(self, target: DeclarativeBase, ids) -> None:
+        """Batch-resolve every traversal path for the given target ids."""
+        ids = tuple(ids)
+        if ids and self._all_paths:
+            await warm_paths(ContextSet(target, ids), *self._all_paths)
+
     async def joins(self, group_ids: Set[int], target: DeclarativeBase) -> List[RelationshipProperty]:
         """
         Generate joins needed for path-based permission checking.
@@ -168,27 +260,28 @@ class Path(PermissionChecker):
         permitted_contexts = await self.auth.contexts_by_permission(group_ids, self.permission)
         if not permitted_contexts:
             return [False]
-        ret = []
+        # Insertion-ordered dedup keyed on the property identity: `in` tests
+        # against a list would invoke RelationshipProperty comparators per
+        # element, which is both slow and quadratic.
+        ret = {}
         if permitted_contexts:
             models = {context.model for context in permitted_contexts}
-            for path in all_paths(self.paths):
+            for steps, recursive_flags, _ in self._compiled_paths(target):
                 # traverse all paths to find the tables where permissions are assigned
                 partial_path = []
                 rec_join = None
-                for prop in class_traverse(target, path):
-                    if prop.target in prop.parent.tables:
+                for prop, is_recursive in zip(steps, recursive_flags):
+                    if is_recursive:
                         rec_join = partial_path.copy()
                     partial_path.append(prop)
                     if prop.entity.class_ in models:
                         if rec_join is not None:
                             for p in rec_join:
-                                if p not in ret:
-                                    ret.append(p)
+                                ret.setdefault(id(p), p)
                             break
                         for p in partial_path:
-                            if p not in ret:
-                                ret.append(p)
-        return ret
+                            ret.setdefault(id(p), p)
+        return list(ret.values())
 
     async def where(self, user: UserMixin, group_ids: Set[int], target: DeclarativeBase) -> List:
         """
@@ -205,21 +298,25 @@ class Path(PermissionChecker):
         """
         # Get permitted models and their IDs
         permitted = {c.model: c.ids for c in await self.auth.contexts_by_permission(group_ids, self.permission)}
+        permitted_models = frozenset(permitted)
 
         # Build the filter conditions
         items = []
+        overjoin = None
 
         # Add conditions for all paths and their targets
-        for path in all_paths(self.paths):
+        for steps, recursive_flags, step_models in self._compiled_paths(target):
+            # Skip whole paths that cannot reach any permitted model.
+            if permitted_models.isdisjoint(step_models):
+                continue
             overjoin = None
             overpath = None
-            for step in class_traverse(target, path):
-                if step.target in step.parent.tables:
+            for step, is_recursive, model in zip(steps, recursive_flags, step_models):
+                if is_recursive:
                     overjoin = []
                     overpath = []
                 if overpath is not None:
                     overpath.append(step)
-                model = self.auth.to_class(step.target)
                 if model in permitted:
                     if overjoin is None:
                         items.append(ContextSet(model, permitted[model]))
@@ -238,9 +335,14 @@ class Path(PermissionChecker):
             items.append(ContextSet(target, permitted[target]))
 
         contexts = aggregate_references(items)
-        if contexts:
-            return or_(*(context.model.id.in_(context.ids) for context in contexts))
-        return False
+        if not contexts:
+            return False
+        # Sorted ids keep the rendered statement deterministic (and thus
+        # cache-friendly); a single context set needs no OR wrapper.
+        conditions = [context.model.id.in_(sorted(context.ids)) for context in contexts]
+        if len(conditions) == 1:
+            return conditions[0]
+        return or_(*conditions)
 
 
 class Owner(PermissionChecker):
@@ -256,6 +358,10 @@ class Owner(PermissionChecker):
         path_length: Number of path components in the path
     """
 
+    __slots__ = ('path', 'path_length', '_parts', '_parent_path', '_traverse_cache')
+
+    cost = 1  # one attribute chain, usually already loaded
+
     def __init__(self, on: str, auth: "Auth" = None):
         """
         Initialize an Owner permission checker.
@@ -266,7 +372,10 @@ class Owner(PermissionChecker):
         """
         self.auth = auth
         self.path = on
-        self.path_length = on.count(".") + 1
+        self._parts = tuple(on.split('.'))
+        self.path_length = len(self._parts)
+        self._parent_path = '.'.join(self._parts[:-1])
+        self._traverse_cache = {}
 
     async def __call__(self, user: UserMixin, group_ids: Set[int], role_ids: Set[int], object: DeclarativeBase) -> bool:
         """
@@ -286,6 +395,12 @@ class Owner(PermissionChecker):
                 return True
         return False
 
+    async def prefetch(self, target: DeclarativeBase, ids) -> None:
+        """Batch-resolve the ownership path for the given target ids."""
+        ids = tuple(ids)
+        if ids:
+            await warm_paths(ContextSet(target, ids), self.path)
+
     async def joins(self, group_ids: Set[int], target: DeclarativeBase) -> List[RelationshipProperty]:
         """
         Generate joins needed for owner-based permission checking.
@@ -297,7 +412,7 @@ class Owner(PermissionChecker):
         Returns:
             List[RelationshipProperty]: List of relationship properties to join
         """
-        return [prop for prop in class_traverse(target, '.'.join(self.path.split('.')[:-1]))]
+        return list(self._class_steps(target, self._parent_path))
 
     def _where_condition(self, attribute, user, group_ids):
         """
@@ -327,7 +442,7 @@ class Owner(PermissionChecker):
             List: SQL WHERE clause conditions
         """
         return self._where_condition(
-            tuple(class_traverse(target, self.path))[-1].class_attribute,
+            self._class_steps(target, self.path)[-1].class_attribute,
             user, group_ids)
 
 
@@ -344,6 +459,10 @@ class Group(Owner):
         path_length: Number of path components in the path
     """
 
+    __slots__ = ()
+
+    cost = 2  # like Owner, plus the group-set membership test
+
     def __init__(self, on: str, auth: "Auth" = None):
         """
         Initialize a Group permission checker.
@@ -354,7 +473,10 @@ class Group(Owner):
         """
         self.auth = auth
         self.path = on
-        self.path_length = on.count(".") + 1
+        self._parts = tuple(on.split('.'))
+        self.path_length = len(self._parts)
+        self._parent_path = '.'.join(self._parts[:-1])
+        self._traverse_cache = {}
 
     async def __call__(self, user: UserMixin, group_ids: Set[int], role_ids: Set[int], object: DeclarativeBase) -> bool:
         """
@@ -370,7 +492,7 @@ class Group(Owner):
             bool: True if user belongs to a relevant group, False otherwise
         """
         async for value in traverse(object, self.path, start=self.path_length):
-            if set(value).intersection(group_ids):
+            if not group_ids.isdisjoint(value):
                 return True
         return False
 
@@ -401,6 +523,10 @@ class Global(PermissionChecker):
         permission: The global permission string to check for
     """
 
+    __slots__ = ('permission',)
+
+    cost = 0  # cached set membership, no traversal
+
     def __init__(self, permission: str, auth: "Auth" = None):
         """
         Initialize a Global permission checker.
@@ -428,11 +554,10 @@ class Global(PermissionChecker):
         from jsalchemy_auth.auth import GLOBAL_CONTEXT
         if self.permission in await self.auth._global_permissions():
             return await self.auth._has_any_role(group_ids, role_ids)
-        for group_id in group_ids:
-            global_role_ids = await self.auth._contextual_roles(group_id, GLOBAL_CONTEXT)
-            if global_role_ids.intersection(role_ids):
-                return True
-        return False
+        # One batched lookup for the whole group set instead of a round trip
+        # per group.
+        global_role_ids = await self.auth._contextual_roles_many(group_ids, GLOBAL_CONTEXT)
+        return not role_ids.isdisjoint(global_role_ids)
 
     async def joins(self, group_ids: Set[int], target: DeclarativeBase) -> List[RelationshipProperty]:
         """
@@ -475,6 +600,8 @@ class Or(PermissionChecker):
         checkers: List of PermissionChecker instances to combine with OR logic
     """
 
+    __slots__ = ('checkers', '_auth')
+
     def __init__(self, *permission_checker):
         """
         Initialize an OR permission checker.
@@ -482,12 +609,20 @@ class Or(PermissionChecker):
         Args:
             *permission_checker: Variable number of PermissionChecker instances
         """
-        self.checkers = permission_checker
+        # Cheapest-first ordering: any branch can prove the permission, so
+        # try the O(1) checks (Global, Owner) before the tree traversals.
+        # The sort is stable, preserving declaration order within a cost.
+        self.checkers = tuple(sorted(permission_checker,
+                                     key=lambda checker: checker.cost))
+        # Stored directly so reads are one slot access; the children carry
+        # the same reference, adopted from the first one here and kept in
+        # sync by the setter below.
+        self._auth = self.checkers[0].auth if self.checkers else None
 
     @property
     def auth(self):
-        """Get the authentication system instance from the first checker."""
-        return self.checkers[0].auth
+        """Get the authentication system instance."""
+        return self._auth
 
     @auth.setter
     def auth(self, auth: "Auth"):
@@ -497,6 +632,7 @@ class Or(PermissionChecker):
         Args:
             auth: The authentication system instance to set
         """
+        self._auth = auth
         for checker in self.checkers:
             checker.auth = auth
 
@@ -513,36 +649,50 @@ class Or(PermissionChecker):
         Returns:
             bool: True if any checker returns True, False otherwise
         """
-        context = to_context(object)
+        # Inner checkers usually hand Contexts back down the composition
+        # tree; skip the conversion call entirely for that common case.
+        context = object if type(object) is Context else to_context(object)
         for checker in self.checkers:
             if await checker(user, group_ids, role_ids, context):
                 return True
         return False
 
-    async def joins(self, user: UserMixin, target: DeclarativeBase, permission_name: str = 'read'):
+    async def prefetch(self, target: DeclarativeBase, ids) -> None:
+        """Warm every wrapped checker, sequentially on the shared session."""
+        for checker in self.checkers:
+            await checker.prefetch(target, ids)
+
+    async def joins(self, group_ids: Set[int], target: DeclarativeBase, permission_name: str = 'read'):
         """
         Generate joins needed for OR permission checking.
 
         Args:
-            user: The user to check permissions for
+            group_ids: Set of group IDs that the user belongs to
             target: The target database model to check permissions for
             permission_name: The name of the permission to check (default: 'read')
 
         Returns:
             List[RelationshipProperty]: List of relationship properties to join
         """
-        return [prop for checker in self.checkers for prop in await checker.joins(user, target)]
+        return [prop for checker in self.checkers for prop in await checker.joins(group_ids, target)]
 
     async def where(self, user: UserMixin, group_ids: Set[int], target: DeclarativeBase) -> List:
-        conditions = [await checker.where(user, group_ids, target) for checker in self.checkers]
-        conditions = [cond for cond in conditions if cond is not None]
-        if any(condition is True for condition in conditions):
-            return True
+        conditions = []
+        for checker in self.checkers:
+            condition = await checker.where(user, group_ids, target)
+            if condition is True:
+                # This sub-checker grants everything: skip the remaining,
+                # typically more expensive, where() computations outright.
+                return true()
+            if condition is not None:
+                conditions.append(condition)
         if len(conditions) == 1:
             return conditions[0]
         if len(conditions) > 1:
             return or_(*conditions)
-        return []
+        # No sub-checker produced a condition: nothing is reachable through
+        # this branch, which as a filter is a plain SQL false.
+        return false()
 
 
 class And(PermissionChecker):
@@ -555,6 +705,8 @@ class And(PermissionChecker):
         checkers: List of PermissionChecker instances to combine with AND logic
     """
 
+    __slots__ = ('checkers', '_auth')
+
     def __init__(self, *permission_checker):
         """
         Initialize an AND permission checker.
@@ -563,11 +715,12 @@ class And(PermissionChecker):
             *permission_checker: Variable number of PermissionChecker instances
         """
         self.checkers = permission_checker
+        self._auth = self.checkers[0].auth if self.checkers else None
 
     @property
     def auth(self):
-        """Get the authentication system instance from the first checker."""
-        return self.checkers[0].auth
+        """Get the authentication system instance."""
+        return self._auth
 
     @auth.setter
     def auth(self, auth: "Auth"):
@@ -577,6 +730,7 @@ class And(PermissionChecker):
         Args:
             auth: The authentication system instance to set
         """
+        self._auth = auth
         for checker in self.checkers:
             checker.auth = auth
 
@@ -593,12 +747,17 @@ class And(PermissionChecker):
         Returns:
             bool: True if all checkers return True, False otherwise
         """
-        context = to_context(object)
+        context = object if type(object) is Context else to_context(object)
         for checker in self.checkers:
-            if not await checker(group_ids, role_ids, context):
+            if not await checker(user, group_ids, role_ids, context):
                 return False
         return True
 
+    async def prefetch(self, target: DeclarativeBase, ids) -> None:
+        """Warm every wrapped checker, sequentially on the shared session."""
+        for checker in self.checkers:
+            await checker.prefetch(target, ids)
+
 
 class Not(PermissionChecker):
     """
@@ -610,6 +769,8 @@ class Not(PermissionChecker):
         checker: The PermissionChecker instance to negate
     """
 
+    __slots__ = ('checker', '_auth')
+
     def __init__(self, permission_checker: PermissionChecker):
         """
         Initialize a NOT permission checker.
@@ -618,11 +779,12 @@ class Not(PermissionChecker):
             permission_checker: The PermissionChecker instance to negate
         """
         self.checker = permission_checker
+        self._auth = permission_checker.auth
 
     @property
     def auth(self):
-        """Get the authentication system instance from the wrapped checker."""
-        return self.checker.auth
+        """Get the authentication system instance."""
+        return self._auth
 
     @auth.setter
     def auth(self, auth: "Auth"):
@@ -632,6 +794,7 @@ class Not(PermissionChecker):
         Args:
             auth: The authentication system instance to set
         """
+        self._auth = auth
         self.checker.auth = auth
 
     async def __call__(self, user: UserMixin, group_ids: Set[int], role_ids: Set[int], object: DeclarativeBase) -> bool:
@@ -647,5 +810,9 @@ class Not(PermissionChecker):
         Returns:
             bool: True if the wrapped checker returns False, False otherwise
         """
-        context = to_context(object)
-        return not await self.checker(group_ids, role_ids, context)
+        context = object if type(object) is Context else to_context(object)
+        return not await self.checker(user, group_ids, role_ids, context)
+
+    async def prefetch(self, target: DeclarativeBase, ids) -> None:
+        """Warm the traversal cache of the wrapped checker."""
+        await self.checker.prefetch(target, ids)
@@ -7,8 +7,8 @@ roles, and permissions.
 """
 
 from typing import List, Optional
-from sqlalchemy.orm import Mapped, mapped_column, DeclarativeBase, declared_attr, relationship
-from sqlalchemy import String, Boolean, Integer, ForeignKey, Table, Column
+from sqlalchemy.orm import Mapped, mapped_column, DeclarativeBase, declared_attr, relationship, backref
+from sqlalchemy import String, Boolean, Integer, ForeignKey, Table, Column, Index
 from sqlalchemy.ext.asyncio import AsyncSession, AsyncEngine
 
 
@@ -109,6 +109,15 @@ def define_tables(Base: DeclarativeBase, User: UserMixin, UserGroup: UserGroupMi
     """
     global role_permission, rolegrant, membership
 
+    if 'rolegrants' in Base.metadata.tables:
+        # The tables were already defined for this metadata: reuse them and
+        # skip re-attaching the relationships, which would re-configure the
+        # mappers on every Auth construction.
+        role_permission = Base.metadata.tables['roles_permissions']
+        rolegrant = Base.metadata.tables['rolegrants']
+        membership = Base.metadata.tables['memberships']
+        return role_permission, rolegrant, membership
+
     # Association tables
     role_permission = Table(
         'roles_permissions',
@@ -133,15 +142,34 @@ def define_tables(Base: DeclarativeBase, User: UserMixin, UserGroup: UserGroupMi
         Column('user_id', Integer, ForeignKey(f'{User.__tablename__}.id'))
     )
 
-    # Establish relationships for UserGroup
-    UserGroup.members = relationship(User, secondary=membership, backref='memberships')
-    UserGroup.granted = relationship(Role, secondary=rolegrant, backref='grants')
+    # Covering indexes for the grant lookups: every contextual-role query
+    # filters rolegrants by (usergroup_id, context_table, context_id) and the
+    # permission resolution scans role_permission by role.
+    Index('ix_rolegrant_ug_ctx',
+          rolegrant.c.usergroup_id, rolegrant.c.context_table, rolegrant.c.context_id)
+    # Context-first variant for the permission checks that filter by context
+    # alone (e.g. the fused has_permission join) before narrowing by group.
+    Index('ix_rolegrant_ctx', rolegrant.c.context_table, rolegrant.c.context_id)
+    Index('ix_roles_permissions_role',
+          role_permission.c.role_id, role_permission.c.permission_id)
+    # The group lookup runs on virtually every check (_user_groups filters
+    # memberships by user); including usergroup_id makes the index covering.
+    Index('ix_membership_user',
+          membership.c.user_id, membership.c.usergroup_id)
+
+    # Establish relationships for UserGroup.
+    # The auth hot paths always materialize these collections fully, so load
+    # them eagerly with one IN query instead of one SELECT per access.
+    UserGroup.members = relationship(User, secondary=membership, lazy='selectin',
+                                     backref=backref('memberships', lazy='selectin'))
+    UserGroup.granted = relationship(Role, secondary=rolegrant, lazy='selectin', backref='grants')
 
     # Add owner relationship to UserGroup
     UserGroup.owner_id: Mapped[Optional[int]] = mapped_column(Integer, ForeignKey(f"{User.__tablename__}.id"))
     UserGroup.owner = relationship(User, backref='self_group')
 
     # Establish relationships for Role
-    Role.permissions = relationship(Permission, secondary=role_permission, backref='roles')
+    Role.permissions = relationship(Permission, secondary=role_permission,
+                                    lazy='selectin', backref='roles')
 
     return role_permission, rolegrant, membership
@@ -309,6 +309,41 @@ async def tree_traverse(object: DeclarativeBase, path: Dict[str, Dict | None], s
                         yield item
 
 
+async def warm_paths(contexts: Context | ContextSet, *paths: str):
+    """
+    Batch-resolve attribute paths into the traversal cache.
+
+    Resolves every level of each dotted path for the whole context set at
+    once: one `_referent` call per level batches the redis lookup and the
+    fallback SELECT over all ids, so a later per-object `traverse` over the
+    same objects is served from the cache instead of resolving one object
+    at a time. Recursive segments are walked level by level until exhausted,
+    mirroring `recursive_traverse`.
+
+    Args:
+        contexts: Context or ContextSet covering the objects about to be traversed
+        *paths: Dot-separated path strings to resolve
+    """
+    if isinstance(contexts, Context):
+        contexts = ContextSet(contexts.model, (contexts.id,))
+    for path in paths:
+        current = contexts
+        for segment in path.split("."):
+            if not isinstance(current, (Context, ContextSet)) or not current:
+                break
+            if is_recursive(current.model, segment):
+                levels = []
+                frontier = current
+                while True:
+                    many, frontier = await _referent(frontier, segment)
+                    if not frontier:
+                        break
+                    levels.append(frontier)
+                current = ContextSet.join(*levels) if levels else None
+            else:
+                many, current = await _referent(current, segment)
+
+
 async def flatten(iterator: AsyncIterable) -> Iterable:
     """
     Flatten an async iterator of iterables.
@@ -4,6 +4,8 @@ This module provides utilities for converting between database objects and conte
 managing context sets, and working with SQLAlchemy relationships.
 """
 
+import asyncio
+from functools import wraps
 from itertools import groupby
 from operator import itemgetter
 from typing import Dict, List
@@ -162,6 +164,10 @@ def to_context(object: DeclarativeBase) -> Context:
     Returns:
         Context: A context representing the object with its model and ID
     """
+    # Exact-type fast path: callers on the hot path mostly pass a Context
+    # already, so skip the isinstance dispatch for that common case.
+    if type(object) is Context:
+        return object
     if isinstance(object, (Context, ContextSet)):
         return object
     return Context(type(object), object.id)
@@ -235,6 +241,36 @@ def table_to_class(Base, table: str):
                      if any(tab.name == table for tab in mapper.tables)))
 
 
+def single_flight(fn):
+    """Collapse concurrent calls with identical arguments into one coroutine.
+
+    While a call for a given argument tuple is in flight, further callers
+    await the same task instead of issuing a duplicate query; the entry is
+    dropped as soon as the task completes, so results are never cached here.
+
+    Args:
+        fn: The coroutine function to deduplicate
+
+    Returns:
+        A wrapped coroutine function sharing in-flight invocations
+    """
+    inflight = {}
+
+    @wraps(fn)
+    async def wrapper(*args, **kwargs):
+        key = args + tuple(sorted(kwargs.items()))
+        task = inflight.get(key)
+        if task is None:
+            inflight[key] = task = asyncio.ensure_future(fn(*args, **kwargs))
+            try:
+                return await task
+            finally:
+                inflight.pop(key, None)
+        return await asyncio.shield(task)
+
+    return wrapper
+
+
 def get_target_table(query):
     """Find the target of a query.
 
@@ -40,7 +40,7 @@ async def test_contextual_roles(context, auth, users, roles, spatial):
         alice_group = await db.scalar(select(auth.group_model).where(auth.group_model.name == 'alice'))
         admin_role = await db.scalar(select(auth.role_model).where(auth.role_model.name == 'admin'))
 
-        roles = await auth._contextual_roles(alice_group.id, to_context(france))
+        roles = await auth._contextual_roles_many(frozenset({alice_group.id}), to_context(france))
 
         assert admin_role.id in roles
 
@@ -50,7 +50,7 @@ async def test_contextual_roles(context, auth, users, roles, spatial):
         france = await db.scalar(select(Country).where(Country.name == 'France'))
         alice_group = await db.scalar(select(auth.group_model).where(auth.group_model.name == 'alice'))
 
-        roles = await auth._contextual_roles(alice_group.id, to_context(france))
+        roles = await auth._contextual_roles_many(frozenset({alice_group.id}), to_context(france))
 
         role_names = set((await db.execute(select(auth.role_model.name).where(auth.role_model.id.in_(roles)))).scalars().all())
         assert role_names == {'admin', 'editor'}
@@ -121,6 +121,35 @@ async def test_revoke(auth, spatial, context, roles, users):
         all_grants = set((await db.execute(select(rolegrant))).all())
         assert len(all_grants) == 0
 
+@pytest.mark.asyncio
+async def test_unassign(auth, context, roles):
+    from jsalchemy_auth.models import role_permission
+
+    async def role_permissions(role_name):
+        return set((await db.execute(
+            select(auth.permission_model.name)
+            .join(role_permission, role_permission.c.permission_id == auth.permission_model.id)
+            .join(auth.role_model, auth.role_model.id == role_permission.c.role_id)
+            .where(auth.role_model.name == role_name))).scalars())
+
+    async with context() as ctx:
+        assert await role_permissions('admin') == {'create', 'read', 'update', 'delete'}
+
+        await auth.unassign('admin', 'create', 'delete')
+
+        assert await role_permissions('admin') == {'read', 'update'}
+        # the other roles' associations and the permissions themselves survive
+        assert await role_permissions('editor') == {'create', 'update'}
+        assert await role_permissions('read-only') == {'read'}
+        permission_names = set((await db.execute(select(auth.permission_model.name))).scalars())
+        assert {'create', 'read', 'update', 'delete'} <= permission_names
+
+        # unassigning an unknown permission or role is a no-op
+        await auth.unassign('admin', 'dontexists')
+        await auth.unassign('dontexists', 'read')
+        assert await role_permissions('admin') == {'read', 'update'}
+        assert await role_permissions('read-only') == {'read'}
+
 @pytest.mark.asyncio
 async def test_permissions(auth, spatial, context, roles, users):
     Country, Department, City = spatial
@@ -213,6 +242,41 @@ async def test_can(auth, spatial, context, roles, users):
         assert await auth.can(charlie, 'read', italy) == True
         assert await auth.can(charlie, 'read', france) == True
 
+@pytest.mark.asyncio
+async def test_has_role(auth, spatial, context, roles, users):
+    from jsalchemy_auth.auth import GLOBAL_CONTEXT
+    Country, Department, City = spatial
+
+    async with context() as ctx:
+        italy = await db.scalar(select(Country).where(Country.name == 'Italy'))
+        alice = await db.get(auth.user_model, 1)
+        alice_group = (await alice.awaitable_attrs.memberships)[0]
+
+        await auth.grant(alice_group, 'admin', italy)
+        await auth.grant(alice_group, 'read-only', GLOBAL_CONTEXT)
+
+    async with context() as ctx:
+        italy = await db.scalar(select(Country).where(Country.name == 'Italy'))
+        france = await db.scalar(select(Country).where(Country.name == 'France'))
+        alice = await db.get(auth.user_model, 1)
+        bob = await db.get(auth.user_model, 2)
+        alice_group = (await alice.awaitable_attrs.memberships)[0]
+        bob_group = (await bob.awaitable_attrs.memberships)[0]
+
+        assert await auth.has_role(alice, 'admin', italy) == True
+        assert await auth.has_role(alice, 'admin', france) == False
+        assert await auth.has_role(bob, 'admin', italy) == False
+        # the default context is the global one
+        assert await auth.has_role(alice, 'read-only') == True
+        assert await auth.has_role(alice, 'admin') == False
+        assert await auth.has_role(bob, 'read-only') == False
+
+        assert await auth.has_role_group(alice_group, 'admin', italy) == True
+        assert await auth.has_role_group(alice_group, 'admin', france) == False
+        assert await auth.has_role_group(bob_group, 'admin', italy) == False
+        assert await auth.has_role_group(alice_group, 'read-only') == True
+        assert await auth.has_role_group(bob_group, 'read-only') == False
+
 # @pytest.mark.skip(reason="Disable due to the caching")
 @pytest.mark.asyncio
 async def test_global_permission(auth, spatial, context, roles, users):
@@ -347,6 +411,37 @@ async def test_get_contexts_by_permission(context, auth, users, spatial, roles):
         can_update = await auth.contexts_by_permission(charlie, 'update')
         assert can_update == {ContextSet(Department, (4,)), ContextSet(City, (4,))}
 
+@pytest.mark.asyncio
+async def test_strict_loading(db_engine, Base, context):
+    from sqlalchemy import String
+    from sqlalchemy.orm import Mapped, mapped_column
+    from jsalchemy_auth import Auth
+    from jsalchemy_auth.auth import GLOBAL_CONTEXT
+    from jsalchemy_auth.models import UserMixin
+
+    class User(UserMixin, Base):
+        __tablename__ = "user"
+        name: Mapped[str] = mapped_column(String(150), unique=True)
+
+    auth = Auth(Base, user_model=User, strict_loading=True)
+
+    async with db_engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    async with context():
+        # every guarded select runs with raiseload('*'): creating the
+        # permissions, resolving the personal group on grant and loading
+        # the permitted objects must not trigger any lazy load
+        await auth.assign('admin', 'read', 'update')
+
+        alice = auth.user_model(name='alice')
+        db.add(alice)
+        await db.flush()
+
+        assert await auth.grant(alice, 'admin', GLOBAL_CONTEXT) == True
+        assert await auth.has_permission(alice, 'read', GLOBAL_CONTEXT) == True
+        assert await auth.has_permission(alice, 'delete', GLOBAL_CONTEXT) == False
+
 
 
 
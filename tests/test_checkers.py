@@ -178,6 +178,78 @@ async def test_user_recursive_path(Base, full_filesystem, User, db_engine, conte
         assert readable_folders == accessible_folders
 
 
+@pytest.mark.asyncio
+async def test_prefetch_warm_paths(Base, full_filesystem, User, db_engine, context):
+
+    build_classes, put_data = full_filesystem
+
+    auth = Auth(Base, user_model=User,
+                actions={
+                    'Folder': {
+                        'read': Path('read', 'parent'),
+                    },
+                    'File': {
+                        'read': Path('read', 'folder.parent.mountpoint'),
+                    }
+                })
+
+    classes = build_classes()
+
+    async with db_engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    MountPoint, Folder, File, Tag = await put_data(classes)
+
+    async with context():
+        alice = User(name='alice', last_name='A', id=1)
+        bob = User(name='bob', last_name='B', id=2)
+
+        db.add_all([alice, bob])
+
+    async with context():
+        await auth.assign('reader', 'read')
+
+        alice = await User.get_by_name('alice')
+        bob = await User.get_by_name('bob')
+        users = {u.name: u for u in [alice, bob]}
+        home_folder = await Folder.get_by_name('home')
+
+        for folder in await home_folder.awaitable_attrs.children:
+            if folder.name in users:
+                await auth.grant(users[folder.name], 'reader', folder)
+        await auth.grant(bob, 'reader', await MountPoint.get_by_name('root'))
+
+    async with context():
+        # unwarmed baseline, resolved object by object
+        alice = await User.get_by_name('alice')
+        bob = await User.get_by_name('bob')
+        all_folders = (await db.execute(select(Folder))).scalars().all()
+        all_files = (await db.execute(select(File))).scalars().all()
+
+        baseline_folders = {f.id for f in all_folders if await auth.can(alice, 'read', f)}
+        baseline_files = {f.id for f in all_files if await auth.can(bob, 'read', f)}
+
+        assert baseline_folders
+        assert baseline_files
+
+    async with context():
+        # batch-resolve the recursive 'parent' path and the multi-hop
+        # 'folder.parent.mountpoint' path before checking object by object
+        alice = await User.get_by_name('alice')
+        bob = await User.get_by_name('bob')
+        all_folders = (await db.execute(select(Folder))).scalars().all()
+        all_files = (await db.execute(select(File))).scalars().all()
+
+        await auth.prefetch(Folder, [f.id for f in all_folders], 'read')
+        await auth.prefetch(File, [f.id for f in all_files], 'read')
+
+        warmed_folders = {f.id for f in all_folders if await auth.can(alice, 'read', f)}
+        warmed_files = {f.id for f in all_files if await auth.can(bob, 'read', f)}
+
+        assert warmed_folders == baseline_folders
+        assert warmed_files == baseline_files
+
+
 
 
 